@@ -1,211 +1,614 @@
+import atexit
+import hashlib
 import json
+import math
 import os
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
 from datetime import datetime
-import pytz
+from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 
 # ---------------- PATH SETUP ---------------- #
-BASE_PATH = os.path.dirname(os.path.abspath(__file__)) + "/"
-DONORS_FILE = BASE_PATH + 'donors.json'
-DONATIONS_FILE = BASE_PATH + 'donations.json'
-RECEIPTS_FOLDER = BASE_PATH + 'receipts/'
-
-if not os.path.exists(RECEIPTS_FOLDER):
-    os.makedirs(RECEIPTS_FOLDER)
+BASE_PATH = Path(__file__).resolve().parent
+DONORS_FILE = str(BASE_PATH / 'donors.json')
+DONATIONS_FILE = str(BASE_PATH / 'donations.json')
+# New donations are appended here one JSON object per line, then folded into
+# DONATIONS_FILE by compact_donations once the log grows past LOG_COMPACT_BYTES
+DONATIONS_LOG = str(BASE_PATH / 'donations.jsonl')
+LOG_COMPACT_BYTES = 256 * 1024
+# Compaction moves the log aside and writes the new snapshot under these names
+# first, so an interrupted compaction can be finished or rolled back
+COMPACTING_LOG = DONATIONS_LOG + '.compacting'
+COMPACTED_FILE = DONATIONS_FILE + '.compacted'
+# Running totals kept in step with every donation change, so reports and the
+# donor summary don't have to rescan all donations
+STATS_FILE = str(BASE_PATH / 'stats.json')
+RECEIPTS_FOLDER = BASE_PATH / 'receipts'
+# Keeps donor names from adding spaces or path separators to receipt filenames
+SAFE_NAME = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# The receipts folder and the pytz timezone are only needed once a donation
+# is recorded, so they're set up on first use rather than at import
+_receipts_ready = False
+_india_tz = None
 
 # ---------------- DATA HANDLING ---------------- #
+# Parsed file contents keyed by path -> (mtime, data, index), so repeated loads
+# in a session skip re-reading the JSON unless the file changed on disk. index
+# is the {name_key: record} dict for DONORS_FILE, built on first use (see
+# load_donor_index) and dropped whenever the data is re-parsed or replaced.
+_cache = {}
+# Files whose cached data has not been written out yet (see batched_writes)
+_dirty = set()
+_batch_depth = 0
+# Path -> (digest, mtime) of the last payload written, to skip no-op saves
+_written = {}
+
 def load_data(file):
+    if file in _dirty:
+        return _cache[file][1]
     try:
-        with open(file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        mtime = os.stat(file).st_mtime
     except FileNotFoundError:
+        _cache.pop(file, None)
         return []
+    cached = _cache.get(file)
+    if cached is None or cached[0] != mtime:
+        with open(file, 'rb') as f:
+            buf = f.read()
+        records = orjson.loads(buf) if orjson is not None else json.loads(buf)
+        # Records written before name_key existed get it filled in once here
+        if isinstance(records, list):
+            for r in records:
+                if 'name_key' not in r:
+                    r['name_key'] = donor_key(r['name'])
+        cached = (mtime, records, None)
+        _cache[file] = cached
+    # The cached object itself is handed out: callers treat it as read-only and
+    # build new lists/dicts for anything they save
+    return cached[1]
+
+def _dumps(data, indent=False):
+    # Produces the same bytes with or without orjson: 2-space indent (the only
+    # indent orjson offers) or a compact single line
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _write_synced(path, buf):
+    # fsync before the caller's os.replace, or a crash can leave the renamed
+    # file empty even though the rename itself survived
+    with open(path, 'wb') as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+
+def _flush(file):
+    data = _cache[file][1]
+    buf = _dumps(data, indent=True)
+    digest = hashlib.blake2b(buf, digest_size=8).digest()
+    try:
+        mtime = os.stat(file).st_mtime
+    except FileNotFoundError:
+        mtime = None
+    if mtime is None or _written.get(file) != (digest, mtime):
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        tmp = file + '.tmp'
+        _write_synced(tmp, buf)
+        os.replace(tmp, file)
+        mtime = os.stat(file).st_mtime
+        _written[file] = (digest, mtime)
+    _cache[file] = (mtime, data, _cache[file][2])
+    _dirty.discard(file)
+
+def _flush_all():
+    for file in list(_dirty):
+        _flush(file)
+
+atexit.register(_flush_all)
 
 def save_data(file, data):
-    with open(file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    _cache[file] = (None, data, None)
+    _dirty.add(file)
+    if not _batch_depth:
+        _flush(file)
+
+# Defers save_data calls inside the block to one write per file on exit
+@contextmanager
+def batched_writes():
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            _flush_all()
+
+def donor_key(name):
+    return name.strip().lower()
+
+def index_donors(donors):
+    return {d['name_key']: d for d in donors}
+
+def load_donor_index():
+    # Kept in the DONORS_FILE cache entry, so lookups don't re-index every call
+    load_data(DONORS_FILE)
+    cached = _cache.get(DONORS_FILE)
+    if cached is None:
+        return {}
+    if cached[2] is None:
+        cached = (cached[0], cached[1], index_donors(cached[1]))
+        _cache[DONORS_FILE] = cached
+    return cached[2]
+
+# ---------------- DONATIONS LOG ---------------- #
+def _iter_log_file(path):
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                yield orjson.loads(line) if orjson is not None else json.loads(line)
+            except ValueError:
+                # Blank or torn line left by an interrupted append
+                continue
+
+def _iter_log():
+    # A log set aside by an interrupted compaction holds the older entries
+    yield from _iter_log_file(COMPACTING_LOG)
+    yield from _iter_log_file(DONATIONS_LOG)
+
+def _iter_snapshot():
+    # Stream records straight off disk when ijson is available and nothing
+    # newer is held in memory, so aggregation doesn't build the whole list
+    if ijson is not None and DONATIONS_FILE not in _dirty:
+        try:
+            mtime = os.stat(DONATIONS_FILE).st_mtime
+        except FileNotFoundError:
+            return
+        cached = _cache.get(DONATIONS_FILE)
+        if cached is None or cached[0] != mtime:
+            with open(DONATIONS_FILE, 'rb') as f:
+                for d in ijson.items(f, 'item', use_float=True):
+                    if 'name_key' not in d:
+                        d['name_key'] = donor_key(d['name'])
+                    yield d
+            return
+    yield from load_data(DONATIONS_FILE)
+
+def iter_donations():
+    _recover_compaction()
+    yield from _iter_snapshot()
+    yield from _iter_log()
+
+def load_donations():
+    _recover_compaction()
+    return load_data(DONATIONS_FILE) + list(_iter_log())
+
+def append_donation(donation):
+    line = _dumps(donation) + b'\n'
+    with open(DONATIONS_LOG, 'a+b') as f:
+        # Terminate a line torn by an interrupted append, or this record would
+        # be glued onto it and skipped as unreadable
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                line = b'\n' + line
+        f.write(line)
+        size = f.tell()
+    if size > LOG_COMPACT_BYTES:
+        compact_donations()
+
+def _commit_snapshot(donations):
+    # The new snapshot is fully on disk before COMPACTING_LOG is removed, and
+    # removing it is the commit point: _recover_compaction keeps or discards
+    # COMPACTED_FILE depending on whether the log it folds in is still there
+    buf = _dumps(donations, indent=True)
+    _write_synced(COMPACTED_FILE, buf)
+    if os.path.exists(COMPACTING_LOG):
+        os.remove(COMPACTING_LOG)
+    os.replace(COMPACTED_FILE, DONATIONS_FILE)
+    mtime = os.stat(DONATIONS_FILE).st_mtime
+    _written[DONATIONS_FILE] = (hashlib.blake2b(buf, digest_size=8).digest(), mtime)
+    _cache[DONATIONS_FILE] = (mtime, donations, None)
+    _dirty.discard(DONATIONS_FILE)
+
+def _recover_compaction():
+    if os.path.exists(COMPACTED_FILE):
+        if os.path.exists(COMPACTING_LOG):
+            os.remove(COMPACTED_FILE)
+        else:
+            os.replace(COMPACTED_FILE, DONATIONS_FILE)
+
+def compact_donations(donations=None):
+    # Rewrite the snapshot with the given (or snapshot + log) donations and
+    # empty the log. The log is renamed aside before the snapshot is written,
+    # so a crash at any point leaves each donation counted exactly once.
+    _recover_compaction()
+    if os.path.exists(COMPACTING_LOG):
+        # Fold in a log left by an interrupted compaction on its own first, so
+        # it never shares a commit step with the live log
+        _commit_snapshot(load_data(DONATIONS_FILE) + list(_iter_log_file(COMPACTING_LOG)))
+    if donations is None:
+        if not os.path.exists(DONATIONS_LOG):
+            return
+        donations = load_donations()
+    if os.path.exists(DONATIONS_LOG):
+        os.replace(DONATIONS_LOG, COMPACTING_LOG)
+    _commit_snapshot(donations)
+
+# ---------------- RUNNING STATS ---------------- #
+# rebuild_stats aggregates donations this many at a time, so memory stays
+# bounded; chunks of at least PANDAS_THRESHOLD are summed with pandas if installed
+STATS_CHUNK = 10000
+PANDAS_THRESHOLD = 2000
+
+def _top_donation(donations):
+    top = None
+    for d in donations:
+        if top is None or d['amount'] > top['amount']:
+            top = d
+    if top is None:
+        return None
+    return {"name": top['name'], "name_key": top['name_key'], "amount": top['amount']}
+
+def _donations_signature():
+    # Size and mtime of every donation file; stats.json records the signature
+    # it was computed against, so a crash between writing a donation and its
+    # stats, or an outside edit, is noticed and the stats rebuilt
+    signature = []
+    for file in (DONATIONS_FILE, COMPACTING_LOG, DONATIONS_LOG):
+        try:
+            st = os.stat(file)
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append([st.st_size, st.st_mtime_ns])
+    return signature
+
+def _aggregate_chunk(stats, per_donor_total, chunk):
+    pd = None
+    if len(chunk) >= PANDAS_THRESHOLD:
+        try:
+            import pandas as pd
+        except ImportError:
+            pass
+    if pd is not None:
+        df = pd.DataFrame(chunk, columns=['name_key', 'amount'])
+        for key, total in df.groupby('name_key')['amount'].sum().items():
+            per_donor_total[key] += float(total)
+        top = chunk[int(df['amount'].idxmax())]
+    else:
+        for d in chunk:
+            per_donor_total[d['name_key']] += d['amount']
+        top = max(chunk, key=lambda d: d['amount'])
+    stats['count'] += len(chunk)
+    if stats['top'] is None or top['amount'] > stats['top']['amount']:
+        stats['top'] = _top_donation([top])
+
+def rebuild_stats():
+    # One pass over the donations, a chunk at a time
+    stats = {"total": 0.0, "count": 0, "top": None}
+    per_donor_total = defaultdict(float)
+    chunk = []
+    for d in iter_donations():
+        chunk.append(d)
+        if len(chunk) == STATS_CHUNK:
+            _aggregate_chunk(stats, per_donor_total, chunk)
+            chunk = []
+    if chunk:
+        _aggregate_chunk(stats, per_donor_total, chunk)
+    stats['total'] = sum(per_donor_total.values())
+    stats['per_donor_total'] = dict(per_donor_total)
+    stats['source'] = _donations_signature()
+    save_data(STATS_FILE, stats)
+    return stats
+
+def load_stats():
+    # Missing (load_data hands back []) or computed against other donation files
+    stats = load_data(STATS_FILE)
+    if not stats or stats.get('source') != _donations_signature():
+        stats = rebuild_stats()
+    return stats
+
+def _stats_for_update():
+    # load_stats returns the cached dict, so copy the parts the updates change
+    stats = load_stats()
+    return dict(stats, per_donor_total=dict(stats['per_donor_total']))
+
+def stats_add_donation(stats, donation):
+    key = donation['name_key']
+    amount = donation['amount']
+    stats['total'] += amount
+    stats['count'] += 1
+    stats['per_donor_total'][key] = stats['per_donor_total'].get(key, 0.0) + amount
+    if stats['top'] is None or amount > stats['top']['amount']:
+        stats['top'] = _top_donation([donation])
+
+def stats_remove_donor(stats, key, removed, remaining):
+    stats['total'] -= stats['per_donor_total'].pop(key, 0.0)
+    stats['count'] -= removed
+    if not stats['count']:
+        stats['total'] = 0.0
+    # Only rescan for the top donation when the deleted donor held it
+    if stats['top'] is not None and stats['top']['name_key'] == key:
+        stats['top'] = _top_donation(remaining)
 
 # ---------------- LOGIC FUNCTIONS ---------------- #
-def add_donor_logic(name, contact):
-    donors = load_data(DONORS_FILE)
+# Logic functions never open dialogs, so scripts and tests can call them
+# directly; the *_logic handlers below turn a Result into a messagebox.
+Result = namedtuple('Result', ['ok', 'title', 'message'])
+# Returned when the user declines a confirmation; the UI shows nothing for it
+CANCELLED = Result(False, "Cancelled", "Nothing was deleted.")
+
+def add_donor(name, contact):
     if not name or not contact:
-        messagebox.showwarning("Input Error", "Both name and contact are required!")
-        return
-    if any(d['name'].strip().lower() == name.lower() for d in donors):
-        messagebox.showwarning("Duplicate", f"Donor '{name}' already exists!")
-        return
-    donors.append({"name": name.strip(), "contact": contact.strip()})
+        return Result(False, "Input Error", "Both name and contact are required!")
+    if donor_key(name) in load_donor_index():
+        return Result(False, "Duplicate", f"Donor '{name}' already exists!")
+    donors = load_data(DONORS_FILE) + [{"name": name.strip(), "name_key": donor_key(name), "contact": contact.strip()}]
     save_data(DONORS_FILE, donors)
-    messagebox.showinfo("Success", f"✅ Donor '{name}' added successfully!")
+    return Result(True, "Success", f"✅ Donor '{name}' added successfully!")
 
-def record_donation_logic(name, amount):
-    donors = load_data(DONORS_FILE)
-    donations = load_data(DONATIONS_FILE)
-
-    donor = next((d for d in donors if d['name'].strip().lower() == name.lower()), None)
+def record_donation(name, amount):
+    global _receipts_ready, _india_tz
+    donor = load_donor_index().get(donor_key(name))
     if not donor:
-        messagebox.showwarning("Not Found", "⚠ Donor not found. Please add them first.")
-        return
+        return Result(False, "Not Found", "⚠ Donor not found. Please add them first.")
 
     try:
         amount = float(amount)
     except ValueError:
-        messagebox.showwarning("Invalid Input", "Enter a valid amount.")
-        return
-
-    india_tz = pytz.timezone('Asia/Kolkata')
-    date = datetime.now(india_tz).strftime("%Y-%m-%d %H:%M:%S %Z")
-
-    donation = {"name": name, "amount": amount, "date": date}
-    donations.append(donation)
-    save_data(DONATIONS_FILE, donations)
-
-    receipt_file = RECEIPTS_FOLDER + f"receipt_{name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d%H%M%S')}.txt"
-    with open(receipt_file, 'w', encoding='utf-8') as f:
-        f.write(f"""
+        return Result(False, "Invalid Input", "Enter a valid amount.")
+    # float() accepts "nan" and "inf", which JSON can't store as numbers
+    if not math.isfinite(amount):
+        return Result(False, "Invalid Input", "Enter a valid amount.")
+
+    if _india_tz is None:
+        import pytz
+        _india_tz = pytz.timezone('Asia/Kolkata')
+    now = datetime.now(_india_tz)
+    date = now.strftime("%Y-%m-%d %H:%M:%S %Z")
+
+    donation = {"name": name, "name_key": donor['name_key'], "amount": amount, "date": date}
+    stats = _stats_for_update()
+    append_donation(donation)
+    stats_add_donation(stats, donation)
+    stats['source'] = _donations_signature()
+    save_data(STATS_FILE, stats)
+
+    if not _receipts_ready:
+        RECEIPTS_FOLDER.mkdir(exist_ok=True)
+        _receipts_ready = True
+    receipt_file = os.path.join(RECEIPTS_FOLDER, f"receipt_{name.translate(SAFE_NAME)}_{now.strftime('%Y%m%d%H%M%S')}.txt")
+    receipt = f"""
 === Charity Donation Receipt ===
 Donor Name : {name}
 Amount     : ₹{amount}
 Date       : {date}
 -------------------------------
 Thank you for your generous donation!
-""")
+""".encode('utf-8')
+    # Unbuffered binary handle: the whole receipt goes out in a single write
+    with open(receipt_file, 'wb', buffering=0) as f:
+        f.write(receipt)
 
-    messagebox.showinfo("Donation Recorded", f"💰 ₹{amount} recorded for {name}\n🧾 Receipt saved:\n{receipt_file}")
+    return Result(True, "Donation Recorded", f"💰 ₹{amount} recorded for {name}\n🧾 Receipt saved:\n{receipt_file}")
 
-def get_donor_summary():
+def get_keyed_donor_summary():
+    # (name_key, row) pairs, so the UI can track rows by the stored key
     donors = load_data(DONORS_FILE)
-    donations = load_data(DONATIONS_FILE)
+    totals = load_stats()['per_donor_total']
     data = []
     for donor in donors:
-        total = sum(d['amount'] for d in donations if d['name'].strip().lower() == donor['name'].strip().lower())
-        data.append((donor['name'], donor['contact'], f"₹{total:.2f}"))
+        total = totals.get(donor['name_key'], 0.0)
+        data.append((donor['name_key'], (donor['name'], donor['contact'], f"₹{total:.2f}")))
     return data
 
-def generate_report_logic():
-    donations = load_data(DONATIONS_FILE)
-    if not donations:
-        messagebox.showinfo("No Data", "⚠ No donations available.")
-        return
-    total = sum(d['amount'] for d in donations)
-    avg = total / len(donations)
-    top = max(donations, key=lambda d: d['amount'])
-    messagebox.showinfo("Donation Report",
-                        f"📊 Total Donations: ₹{total:.2f}\n"
-                        f"Average Donation: ₹{avg:.2f}\n"
-                        f"Top Donor: {top['name']} (₹{top['amount']})")
-
-def delete_specific_donor_logic(name):
-    donors = load_data(DONORS_FILE)
-    donations = load_data(DONATIONS_FILE)
-
+def get_donor_summary():
+    return [row for _, row in get_keyed_donor_summary()]
+
+def generate_report():
+    stats = load_stats()
+    if not stats['count']:
+        return Result(False, "No Data", "⚠ No donations available.")
+    total = stats['total']
+    avg = total / stats['count']
+    top = stats['top']
+    return Result(True, "Donation Report",
+                  f"📊 Total Donations: ₹{total:.2f}\n"
+                  f"Average Donation: ₹{avg:.2f}\n"
+                  f"Top Donor: {top['name']} (₹{top['amount']})")
+
+def delete_specific_donor(name, confirm=None):
+    # confirm, if given, is called with the name once the donor is known to
+    # exist; returning False cancels the delete and this returns CANCELLED
     if not name:
-        messagebox.showwarning("Input Error", "Please enter a donor name!")
-        return
-
-    if not any(d['name'].strip().lower() == name.lower() for d in donors):
-        messagebox.showwarning("Not Found", f"No donor found with name '{name}'.")
-        return
-
-    confirm = messagebox.askyesno("Confirm", f"Delete donor '{name}' and their donations?")
-    if confirm:
-        donors = [d for d in donors if d['name'].strip().lower() != name.lower()]
-        donations = [d for d in donations if d['name'].strip().lower() != name.lower()]
+        return Result(False, "Input Error", "Please enter a donor name!")
+
+    key = donor_key(name)
+    if key not in load_donor_index():
+        return Result(False, "Not Found", f"No donor found with name '{name}'.")
+
+    if confirm is not None and not confirm(name):
+        return CANCELLED
+
+    # Donations are only loaded once the delete is actually going ahead
+    donors = [d for d in load_data(DONORS_FILE) if d['name_key'] != key]
+    stats = _stats_for_update()
+    all_donations = load_donations()
+    donations = [d for d in all_donations if d['name_key'] != key]
+    stats_remove_donor(stats, key, len(all_donations) - len(donations), donations)
+    with batched_writes():
         save_data(DONORS_FILE, donors)
-        save_data(DONATIONS_FILE, donations)
-        messagebox.showinfo("Deleted", f"🗑 Donor '{name}' and their donations deleted successfully!")
-
-def delete_all_data_logic():
-    confirm = messagebox.askyesno("Confirm", "⚠ Delete ALL donors and donations?")
-    if confirm:
-        if os.path.exists(DONORS_FILE):
-            os.remove(DONORS_FILE)
-        if os.path.exists(DONATIONS_FILE):
-            os.remove(DONATIONS_FILE)
-        messagebox.showinfo("Deleted", "🧹 All data deleted successfully!")
-
-# ---------------- UI DESIGN ---------------- #
-root = tk.Tk()
-root.title("💖 Charity Donation Tracker")
-root.geometry("700x550")
-root.configure(bg="#f8f9fa")
-root.resizable(False, False)
-
-style = ttk.Style()
-style.theme_use("clam")
-style.configure("TNotebook.Tab", padding=[15, 8], font=("Arial", 10, "bold"))
-style.configure("TButton", font=("Arial", 10, "bold"), foreground="#fff", background="#0078D7")
-style.map("TButton", background=[("active", "#005A9E")])
-
-title_label = tk.Label(root, text="💖 Charity Donation Tracker 💖",
-                       font=("Helvetica", 16, "bold"), bg="#0078D7", fg="white", pady=10)
-title_label.pack(fill='x')
-
-notebook = ttk.Notebook(root)
-notebook.pack(fill="both", expand=True, padx=15, pady=15)
-
-# ----- TAB: Add Donor ----- #
-tab_add = ttk.Frame(notebook, padding=20)
-notebook.add(tab_add, text="➕ Add Donor")
-
-tk.Label(tab_add, text="Donor Name:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=5)
-entry_name = tk.Entry(tab_add, width=35, font=("Arial", 10))
-entry_name.grid(row=0, column=1, pady=5)
-
-tk.Label(tab_add, text="Contact:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=5)
-entry_contact = tk.Entry(tab_add, width=35, font=("Arial", 10))
-entry_contact.grid(row=1, column=1, pady=5)
+        compact_donations(donations)
+        stats['source'] = _donations_signature()
+        save_data(STATS_FILE, stats)
+    return Result(True, "Deleted", f"🗑 Donor '{name}' and their donations deleted successfully!")
+
+def delete_all_data(confirm=None):
+    # confirm, if given, is called with no arguments; returning False cancels
+    # the delete and this returns CANCELLED
+    if confirm is not None and not confirm():
+        return CANCELLED
+    for file in (DONORS_FILE, DONATIONS_FILE, DONATIONS_LOG, COMPACTING_LOG, COMPACTED_FILE, STATS_FILE):
+        if os.path.exists(file):
+            os.remove(file)
+        _cache.pop(file, None)
+        _dirty.discard(file)
+        _written.pop(file, None)
+    return Result(True, "Deleted", "🧹 All data deleted successfully!")
+
+# ---------------- UI HANDLERS ---------------- #
+def show_result(result):
+    if result.ok:
+        messagebox.showinfo(result.title, result.message)
+    else:
+        messagebox.showwarning(result.title, result.message)
 
-tk.Button(tab_add, text="Add Donor", width=25,
-          command=lambda: add_donor_logic(entry_name.get(), entry_contact.get())).grid(row=2, column=0, columnspan=2, pady=15)
-
-# ----- TAB: Record Donation ----- #
-tab_donate = ttk.Frame(notebook, padding=20)
-notebook.add(tab_donate, text="💰 Record Donation")
-
-tk.Label(tab_donate, text="Donor Name:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=5)
-entry_dname = tk.Entry(tab_donate, width=35, font=("Arial", 10))
-entry_dname.grid(row=0, column=1, pady=5)
-
-tk.Label(tab_donate, text="Amount (₹):", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=5)
-entry_amount = tk.Entry(tab_donate, width=35, font=("Arial", 10))
-entry_amount.grid(row=1, column=1, pady=5)
-
-tk.Button(tab_donate, text="Record Donation", width=25,
-          command=lambda: record_donation_logic(entry_dname.get(), entry_amount.get())).grid(row=2, column=0, columnspan=2, pady=15)
-
-# ----- TAB: View Donors ----- #
-tab_view = ttk.Frame(notebook, padding=20)
-notebook.add(tab_view, text="📋 View Donors")
-
-tree = ttk.Treeview(tab_view, columns=("Name", "Contact", "Total Donated"), show="headings", height=12)
-for col in ("Name", "Contact", "Total Donated"):
-    tree.heading(col, text=col)
-    tree.column(col, width=200)
-tree.pack(pady=10, fill='x')
-
-def refresh_donor_list():
-    for i in tree.get_children():
-        tree.delete(i)
-    for row in get_donor_summary():
-        tree.insert("", tk.END, values=row)
-
-tk.Button(tab_view, text="🔄 Refresh List", width=20, command=refresh_donor_list).pack(pady=10)
+def add_donor_logic(name, contact):
+    show_result(add_donor(name, contact))
 
-# ----- TAB: Reports / Settings ----- #
-tab_report = ttk.Frame(notebook, padding=20)
-notebook.add(tab_report, text="📊 Reports / Settings")
+def record_donation_logic(name, amount):
+    show_result(record_donation(name, amount))
 
-tk.Button(tab_report, text="📈 Generate Report", width=30, command=generate_report_logic).pack(pady=10)
-tk.Button(tab_report, text="🧹 Delete All Data", width=30, command=delete_all_data_logic).pack(pady=10)
+def generate_report_logic():
+    result = generate_report()
+    # Both the report and the "no data" notice are informational
+    messagebox.showinfo(result.title, result.message)
 
-tk.Label(tab_report, text="Delete Specific Donor:", font=("Arial", 10, "bold")).pack(pady=(20, 5))
-entry_del_name = tk.Entry(tab_report, width=35, font=("Arial", 10))
-entry_del_name.pack(pady=5)
-tk.Button(tab_report, text="🗑 Delete Donor", width=30,
-          command=lambda: delete_specific_donor_logic(entry_del_name.get())).pack(pady=10)
+def delete_specific_donor_logic(name):
+    result = delete_specific_donor(
+        name, confirm=lambda n: messagebox.askyesno("Confirm", f"Delete donor '{n}' and their donations?"))
+    if result is not CANCELLED:
+        show_result(result)
 
-tk.Label(tab_report, text="⚠ Deleting data will reset the tracker.", fg="red", font=("Arial", 9, "italic")).pack(pady=5)
+def delete_all_data_logic():
+    result = delete_all_data(
+        confirm=lambda: messagebox.askyesno("Confirm", "⚠ Delete ALL donors and donations?"))
+    if result is not CANCELLED:
+        show_result(result)
 
-root.mainloop()
+# ---------------- UI DESIGN ---------------- #
+def main():
+    compact_donations()
+
+    root = tk.Tk()
+    root.title("💖 Charity Donation Tracker")
+    root.geometry("700x550")
+    root.configure(bg="#f8f9fa")
+    root.resizable(False, False)
+
+    # Shared font objects, so Tk resolves each font once instead of per widget
+    bold_font = tkfont.Font(family="Arial", size=10, weight="bold")
+    normal_font = tkfont.Font(family="Arial", size=10)
+
+    style = ttk.Style()
+    style.theme_use("clam")
+    style.configure("TNotebook.Tab", padding=[15, 8], font=bold_font)
+    style.configure("TButton", font=bold_font, foreground="#fff", background="#0078D7")
+    style.map("TButton", background=[("active", "#005A9E")])
+
+    title_label = tk.Label(root, text="💖 Charity Donation Tracker 💖",
+                           font=("Helvetica", 16, "bold"), bg="#0078D7", fg="white", pady=10)
+    title_label.pack(fill='x')
+
+    notebook = ttk.Notebook(root)
+    notebook.pack(fill="both", expand=True, padx=15, pady=15)
+
+    # ----- TAB: Add Donor ----- #
+    tab_add = ttk.Frame(notebook, padding=20)
+    notebook.add(tab_add, text="➕ Add Donor")
+
+    tk.Label(tab_add, text="Donor Name:", font=bold_font).grid(row=0, column=0, sticky="w", pady=5)
+    entry_name = tk.Entry(tab_add, width=35, font=normal_font)
+    entry_name.grid(row=0, column=1, pady=5)
+
+    tk.Label(tab_add, text="Contact:", font=bold_font).grid(row=1, column=0, sticky="w", pady=5)
+    entry_contact = tk.Entry(tab_add, width=35, font=normal_font)
+    entry_contact.grid(row=1, column=1, pady=5)
+
+    tk.Button(tab_add, text="Add Donor", width=25,
+              command=lambda: add_donor_logic(entry_name.get(), entry_contact.get())).grid(row=2, column=0, columnspan=2, pady=15)
+
+    # ----- TAB: Record Donation ----- #
+    tab_donate = ttk.Frame(notebook, padding=20)
+    notebook.add(tab_donate, text="💰 Record Donation")
+
+    tk.Label(tab_donate, text="Donor Name:", font=bold_font).grid(row=0, column=0, sticky="w", pady=5)
+    entry_dname = tk.Entry(tab_donate, width=35, font=normal_font)
+    entry_dname.grid(row=0, column=1, pady=5)
+
+    tk.Label(tab_donate, text="Amount (₹):", font=bold_font).grid(row=1, column=0, sticky="w", pady=5)
+    entry_amount = tk.Entry(tab_donate, width=35, font=normal_font)
+    entry_amount.grid(row=1, column=1, pady=5)
+
+    tk.Button(tab_donate, text="Record Donation", width=25,
+              command=lambda: record_donation_logic(entry_dname.get(), entry_amount.get())).grid(row=2, column=0, columnspan=2, pady=15)
+
+    # ----- TAB: View Donors ----- #
+    tab_view = ttk.Frame(notebook, padding=20)
+    notebook.add(tab_view, text="📋 View Donors")
+
+    tree_columns = ("Name", "Contact", "Total Donated")
+    tree = ttk.Treeview(tab_view, columns=tree_columns, show="headings", height=12)
+    for col in tree_columns:
+        tree.heading(col, text=col)
+        tree.column(col, width=200)
+    tree.pack(pady=10, fill='x')
+
+    # Donor name_key -> (tree item id, row values) currently shown in the tree
+    tree_rows = {}
+
+    def refresh_donor_list():
+        # Only touch the rows that were added, changed or removed since last refresh
+        seen = set()
+        for key, row in get_keyed_donor_summary():
+            seen.add(key)
+            current = tree_rows.get(key)
+            if current is None:
+                tree_rows[key] = (tree.insert("", tk.END, values=row), row)
+            elif current[1] != row:
+                tree.item(current[0], values=row)
+                tree_rows[key] = (current[0], row)
+        stale = [tree_rows.pop(key)[0] for key in list(tree_rows) if key not in seen]
+        if stale:
+            tree.delete(*stale)
+
+    tk.Button(tab_view, text="🔄 Refresh List", width=20, command=refresh_donor_list).pack(pady=10)
+
+    # ----- TAB: Reports / Settings ----- #
+    tab_report = ttk.Frame(notebook, padding=20)
+    notebook.add(tab_report, text="📊 Reports / Settings")
+
+    tk.Button(tab_report, text="📈 Generate Report", width=30, command=generate_report_logic).pack(pady=10)
+    tk.Button(tab_report, text="🧹 Delete All Data", width=30, command=delete_all_data_logic).pack(pady=10)
+
+    tk.Label(tab_report, text="Delete Specific Donor:", font=bold_font).pack(pady=(20, 5))
+    entry_del_name = tk.Entry(tab_report, width=35, font=normal_font)
+    entry_del_name.pack(pady=5)
+    tk.Button(tab_report, text="🗑 Delete Donor", width=30,
+              command=lambda: delete_specific_donor_logic(entry_del_name.get())).pack(pady=10)
+
+    tk.Label(tab_report, text="⚠ Deleting data will reset the tracker.", fg="red", font=("Arial", 9, "italic")).pack(pady=5)
+
+    root.mainloop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import importlib.util
+import os
+import shutil
+import types
+
+import pytest
+
+SOURCE = os.path.join(os.path.dirname(__file__), 'charity_tracker.py')
+
+
+@pytest.fixture
+def dialogs():
+    # Records messagebox calls instead of opening dialogs; askyesno answers yes
+    calls = []
+    return types.SimpleNamespace(
+        calls=calls,
+        showinfo=lambda title, message: calls.append(('info', title, message)),
+        showwarning=lambda title, message: calls.append(('warning', title, message)),
+        askyesno=lambda title, message: True,
+    )
+
+
+@pytest.fixture
+def ct(tmp_path, dialogs):
+    # Import a fresh copy of the module from tmp_path so every data file lands there
+    shutil.copy(SOURCE, tmp_path)
+    spec = importlib.util.spec_from_file_location('charity_tracker', tmp_path / 'charity_tracker.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.messagebox = dialogs
+    return module
@@ -0,0 +1,350 @@
+import json
+import os
+
+import pytest
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_load_data_reuses_parsed_data_until_file_changes(ct):
+    ct.save_data(ct.DONORS_FILE, [{"name": "Piyush", "contact": "1"}])
+    first = ct.load_data(ct.DONORS_FILE)
+    assert ct.load_data(ct.DONORS_FILE) is first
+
+    write_json(ct.DONORS_FILE, [{"name": "Arjun", "contact": "2"}])
+    st = os.stat(ct.DONORS_FILE)
+    os.utime(ct.DONORS_FILE, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert [d['name'] for d in ct.load_data(ct.DONORS_FILE)] == ["Arjun"]
+
+
+def test_delete_all_data_clears_cache(ct):
+    ct.add_donor_logic("Piyush", "1")
+    ct.delete_all_data_logic()
+    assert ct.load_data(ct.DONORS_FILE) == []
+
+
+def test_add_donor_rejects_duplicate_name(ct, dialogs):
+    ct.add_donor_logic("Piyush", "1")
+    ct.add_donor_logic(" piyush ", "2")
+    assert dialogs.calls[-1][:2] == ('warning', 'Duplicate')
+    assert len(ct.load_data(ct.DONORS_FILE)) == 1
+
+
+def test_record_donation_for_unknown_donor(ct, dialogs):
+    ct.record_donation_logic("Nobody", "10")
+    assert dialogs.calls[-1][:2] == ('warning', 'Not Found')
+
+
+def test_donor_index_is_reused_until_donors_change(ct):
+    ct.add_donor_logic("Piyush", "1")
+    index = ct.load_donor_index()
+    ct.record_donation_logic("Piyush", "10")
+    assert ct.load_donor_index() is index
+    ct.add_donor_logic("Arjun", "2")
+    assert set(ct.load_donor_index()) == {"piyush", "arjun"}
+
+
+def test_donor_summary_totals_per_donor(ct):
+    ct.add_donor_logic("Piyush", "1")
+    ct.add_donor_logic("Arjun", "2")
+    ct.record_donation_logic("piyush", "100")
+    ct.record_donation_logic("Piyush", "50")
+    assert ct.get_donor_summary() == [("Piyush", "1", "₹150.00"), ("Arjun", "2", "₹0.00")]
+
+
+def test_keyed_donor_summary_uses_stored_name_key(ct):
+    write_json(ct.DONORS_FILE, [{"name": "Piyush ", "name_key": "piyush", "contact": "1"}])
+    assert ct.get_keyed_donor_summary() == [("piyush", ("Piyush ", "1", "₹0.00"))]
+
+
+def test_records_without_name_key_get_it_on_load(ct):
+    write_json(ct.DONORS_FILE, [{"name": " Piyush ", "contact": "1"}])
+    assert ct.load_data(ct.DONORS_FILE)[0]['name_key'] == "piyush"
+
+
+def test_batched_writes_defers_saves(ct):
+    ct.add_donor_logic("Piyush", "1")
+    with ct.batched_writes():
+        ct.add_donor_logic("Arjun", "2")
+        assert len(read_json(ct.DONORS_FILE)) == 1
+        assert len(ct.load_data(ct.DONORS_FILE)) == 2
+    assert len(read_json(ct.DONORS_FILE)) == 2
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_load_round_trip(ct, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(ct, 'orjson', None)
+    donors = [{"name": "Kuljeet ₹", "name_key": "kuljeet ₹", "contact": "1"}]
+    ct.save_data(ct.DONORS_FILE, donors)
+    ct._cache.clear()
+    assert ct.load_data(ct.DONORS_FILE) == donors
+
+
+def read_receipt(ct):
+    [receipt] = os.listdir(ct.RECEIPTS_FOLDER)
+    with open(os.path.join(ct.RECEIPTS_FOLDER, receipt), encoding='utf-8') as f:
+        return receipt, f.read()
+
+
+def test_receipt_written_for_donation(ct):
+    ct.add_donor_logic("Piyush", "1")
+    ct.record_donation_logic("Piyush", "150")
+    _, text = read_receipt(ct)
+    assert "Donor Name : Piyush" in text
+    assert "Amount     : ₹150.0" in text
+
+
+def test_receipt_name_uses_donation_timestamp(ct):
+    ct.add_donor_logic("Piyush", "1")
+    ct.record_donation_logic("Piyush", "150")
+    receipt, text = read_receipt(ct)
+    date = text.split("Date       : ")[1][:19]
+    stamp = "".join(c for c in date if c.isdigit())
+    assert receipt == f"receipt_Piyush_{stamp}.txt"
+
+
+def test_delete_donor_removes_their_donations(ct, dialogs):
+    ct.add_donor_logic("Piyush", "1")
+    ct.add_donor_logic("Arjun", "2")
+    ct.record_donation_logic("Piyush", "100")
+    ct.record_donation_logic("Arjun", "50")
+    ct.delete_specific_donor_logic("PIYUSH")
+    assert dialogs.calls[-1][:2] == ('info', 'Deleted')
+    assert ct.get_donor_summary() == [("Arjun", "2", "₹50.00")]
+
+
+def test_delete_unknown_donor(ct, dialogs):
+    ct.delete_specific_donor_logic("Nobody")
+    assert dialogs.calls[-1][:2] == ('warning', 'Not Found')
+
+
+def test_unchanged_save_skips_write(ct):
+    ct.add_donor_logic("Piyush", "1")
+    before = os.stat(ct.DONORS_FILE).st_mtime_ns
+    ct.save_data(ct.DONORS_FILE, list(ct.load_data(ct.DONORS_FILE)))
+    assert os.stat(ct.DONORS_FILE).st_mtime_ns == before
+    assert not os.path.exists(ct.DONORS_FILE + '.tmp')
+
+
+def test_save_fsyncs_before_replacing(ct, monkeypatch):
+    calls = []
+    real_fsync, real_replace = os.fsync, os.replace
+    monkeypatch.setattr(ct.os, 'fsync', lambda fd: (calls.append('fsync'), real_fsync(fd)))
+    monkeypatch.setattr(ct.os, 'replace', lambda src, dst: (calls.append('replace'), real_replace(src, dst)))
+    ct.add_donor_logic("Piyush", "1")
+    assert calls == ['fsync', 'replace']
+
+
+def test_receipt_filename_is_sanitised(ct):
+    ct.add_donor_logic("../Mr Smith", "1")
+    ct.record_donation_logic("../Mr Smith", "5")
+    receipt, _ = read_receipt(ct)
+    assert receipt.startswith("receipt_.._Mr_Smith_")
+
+
+class FakeIjson:
+    # Stands in for ijson so the streaming branch runs without the package
+    def __init__(self):
+        self.calls = 0
+
+    def items(self, f, prefix, use_float=False):
+        assert prefix == 'item' and use_float
+        self.calls += 1
+        return iter(json.load(f))
+
+
+def test_iter_donations_streams_snapshot_with_ijson(ct, monkeypatch):
+    write_json(ct.DONATIONS_FILE, [
+        {"name": "Piyush", "amount": 100.0, "date": ""},
+        {"name": "Arjun", "amount": 50.0, "date": ""},
+    ])
+    fake = FakeIjson()
+    monkeypatch.setattr(ct, 'ijson', fake)
+    donations = list(ct.iter_donations())
+    assert fake.calls == 1
+    assert [(d['name_key'], d['amount']) for d in donations] == [("piyush", 100.0), ("arjun", 50.0)]
+
+
+def test_donations_are_appended_to_log(ct):
+    ct.add_donor_logic("Arjun", "1")
+    ct.record_donation_logic("Arjun", "10")
+    ct.record_donation_logic("Arjun", "20")
+    assert not os.path.exists(ct.DONATIONS_FILE)
+    with open(ct.DONATIONS_LOG, encoding='utf-8') as f:
+        assert len(f.readlines()) == 2
+    assert [d['amount'] for d in ct.load_donations()] == [10.0, 20.0]
+
+
+def test_log_is_compacted_into_snapshot(ct, monkeypatch):
+    monkeypatch.setattr(ct, 'LOG_COMPACT_BYTES', 200)
+    ct.add_donor_logic("Arjun", "1")
+    for amount in range(1, 6):
+        ct.record_donation_logic("Arjun", str(amount))
+    ct.compact_donations()
+    assert not os.path.exists(ct.DONATIONS_LOG)
+    assert [d['amount'] for d in read_json(ct.DONATIONS_FILE)] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert ct.get_donor_summary() == [("Arjun", "1", "₹15.00")]
+
+
+def stats_totals(ct):
+    stats = ct.load_stats()
+    return stats['total'], stats['count']
+
+
+def test_report_after_deleting_donor(ct, dialogs):
+    ct.add_donor_logic("Piyush", "1")
+    ct.add_donor_logic("Arjun", "2")
+    ct.record_donation_logic("Piyush", "1000")
+    ct.record_donation_logic("Arjun", "150")
+    ct.record_donation_logic("Arjun", "50")
+    ct.delete_specific_donor_logic("Piyush")
+    assert stats_totals(ct) == (200.0, 2)
+    ct.generate_report_logic()
+    assert "Total Donations: ₹200.00" in dialogs.calls[-1][2]
+    assert "Top Donor: Arjun (₹150.0)" in dialogs.calls[-1][2]
+
+
+def test_stats_rebuilt_when_missing(ct):
+    ct.add_donor_logic("Piyush", "1")
+    ct.record_donation_logic("Piyush", "100")
+    ct.record_donation_logic("Piyush", "50")
+    os.remove(ct.STATS_FILE)
+    ct._cache.clear()
+    assert stats_totals(ct) == (150.0, 2)
+
+
+def test_receipts_folder_created_on_first_donation(ct):
+    assert not os.path.exists(ct.RECEIPTS_FOLDER)
+    ct.add_donor_logic("Piyush", "1")
+    ct.record_donation_logic("Piyush", "10")
+    assert os.path.isdir(ct.RECEIPTS_FOLDER)
+
+
+def test_import_has_no_side_effects(ct, tmp_path):
+    assert set(os.listdir(tmp_path)) <= {'charity_tracker.py', '__pycache__'}
+
+
+def test_logic_functions_return_results_without_dialogs(ct, dialogs):
+    assert ct.add_donor("Piyush", "1") == ct.Result(True, "Success", "✅ Donor 'Piyush' added successfully!")
+    assert ct.record_donation("Piyush", "abc") == ct.Result(False, "Invalid Input", "Enter a valid amount.")
+    assert ct.record_donation("Piyush", "10").ok
+    assert ct.delete_specific_donor("Piyush").ok
+    assert ct.generate_report() == ct.Result(False, "No Data", "⚠ No donations available.")
+    assert dialogs.calls == []
+
+
+@pytest.mark.parametrize("amount", ["abc", "nan", "inf", "-inf"])
+def test_record_donation_rejects_invalid_amount(ct, amount):
+    ct.add_donor("Piyush", "1")
+    result = ct.record_donation("Piyush", amount)
+    assert result == ct.Result(False, "Invalid Input", "Enter a valid amount.")
+    assert not os.path.exists(ct.DONATIONS_LOG)
+
+
+def test_json_output_does_not_depend_on_orjson(ct, monkeypatch):
+    pytest.importorskip('orjson')
+    data = [{"name": "Kuljeet ₹", "amount": 10037.0, "top": None}]
+    with_orjson = ct._dumps(data, indent=True)
+    monkeypatch.setattr(ct, 'orjson', None)
+    assert ct._dumps(data, indent=True) == with_orjson
+
+
+@pytest.mark.parametrize("crash_at", ["commit", "replace"])
+def test_interrupted_compaction_counts_each_donation_once(ct, monkeypatch, crash_at):
+    ct.add_donor("Arjun", "1")
+    ct.record_donation("Arjun", "10")
+    ct.compact_donations()
+    ct.record_donation("Arjun", "20")
+    ct.record_donation("Arjun", "30")
+
+    real_remove, real_replace = os.remove, os.replace
+
+    def remove(path):
+        if crash_at == "commit" and path == ct.COMPACTING_LOG:
+            raise KeyboardInterrupt
+        real_remove(path)
+
+    def replace(src, dst):
+        if crash_at == "replace" and src == ct.COMPACTED_FILE:
+            raise KeyboardInterrupt
+        real_replace(src, dst)
+
+    with monkeypatch.context() as m:
+        m.setattr(ct.os, 'remove', remove)
+        m.setattr(ct.os, 'replace', replace)
+        with pytest.raises(KeyboardInterrupt):
+            ct.compact_donations()
+    ct._cache.clear()
+
+    assert [d['amount'] for d in ct.load_donations()] == [10.0, 20.0, 30.0]
+    ct.compact_donations()
+    assert [d['amount'] for d in ct.load_donations()] == [10.0, 20.0, 30.0]
+
+
+def test_torn_log_line_does_not_swallow_next_donation(ct):
+    ct.add_donor("Arjun", "1")
+    ct.record_donation("Arjun", "10")
+    with open(ct.DONATIONS_LOG, 'ab') as f:
+        f.write(b'{"name": "Arjun", "amo')
+    ct.record_donation("Arjun", "20")
+    assert [d['amount'] for d in ct.load_donations()] == [10.0, 20.0]
+
+
+def test_stats_rebuilt_after_outside_edit(ct):
+    ct.add_donor("Piyush", "1")
+    ct.record_donation("Piyush", "100")
+    ct.compact_donations()
+    donations = read_json(ct.DONATIONS_FILE)
+    donations.append({"name": "Arjun", "amount": 1000.0, "date": "2025-10-29 11:56:21 IST"})
+    write_json(ct.DONATIONS_FILE, donations)
+    assert stats_totals(ct) == (1100.0, 2)
+
+
+def test_stats_rebuilt_after_crash_before_stats_save(ct):
+    ct.add_donor("Piyush", "1")
+    ct.record_donation("Piyush", "100")
+    ct.append_donation({"name": "Arjun", "name_key": "arjun", "amount": 5.0, "date": ""})
+    assert stats_totals(ct) == (105.0, 2)
+
+
+def test_stats_with_pandas_match_plain_sums(ct, monkeypatch):
+    pytest.importorskip('pandas')
+    ct.add_donor("Piyush", "1")
+    ct.add_donor("Arjun", "2")
+    for name, amount in [("Piyush", "5"), ("Arjun", "7"), ("Arjun", "1"), ("Piyush", "9"), ("Arjun", "3")]:
+        ct.record_donation(name, amount)
+    plain = ct.rebuild_stats()
+    monkeypatch.setattr(ct, 'PANDAS_THRESHOLD', 1)
+    monkeypatch.setattr(ct, 'STATS_CHUNK', 2)
+    vectorised = ct.rebuild_stats()
+    assert {k: vectorised[k] for k in ('total', 'count', 'top', 'per_donor_total')} == \
+        {k: plain[k] for k in ('total', 'count', 'top', 'per_donor_total')}
+
+
+def test_delete_donor_cancelled(ct):
+    ct.add_donor("Piyush", "1")
+    ct.record_donation("Piyush", "10")
+    assert ct.delete_specific_donor("Piyush", confirm=lambda name: False) is ct.CANCELLED
+    assert stats_totals(ct) == (10.0, 1)
+
+
+def test_delete_all_data_cancelled(ct, dialogs):
+    ct.add_donor("Piyush", "1")
+    assert ct.delete_all_data(confirm=lambda: False) is ct.CANCELLED
+    assert len(ct.load_data(ct.DONORS_FILE)) == 1
+    dialogs.askyesno = lambda title, message: False
+    ct.delete_all_data_logic()
+    assert dialogs.calls == []
+    assert ct.delete_all_data(confirm=lambda: True).ok
+    assert ct.load_data(ct.DONORS_FILE) == []